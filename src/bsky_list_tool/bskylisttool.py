@@ -1,11 +1,37 @@
 #!/usr/bin/env python3
 
-from atproto import Client, IdResolver, models
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import random
+import sqlite3
+import sys
+import time
 from configparser import ConfigParser, NoOptionError
+from functools import cache, partial
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Union
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Callable, Union
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    import httpx
 
 
+PUBLIC_API_URL = 'https://public.api.bsky.app'
+PAGE_LIMIT = 100
+APPLY_WRITES_BATCH_SIZE = 200
+WRITE_BUFFER_SIZE = 1024 * 1024
+# HTTP/2 needs the optional h2 package (pip install httpx[http2])
+HTTP2 = find_spec('h2') is not None
+HTTP_LIMITS = {'max_keepalive_connections': 20, 'keepalive_expiry': 60}
+CACHE_TTL = 3600
+RETRY_ATTEMPTS = 5
+MAX_RETRY_BACKOFF = 60
+
 
 class ListNotFoundException(Exception):
     def __init__(self, message):
@@ -13,15 +39,78 @@ class ListNotFoundException(Exception):
 
 
 
+class RateLimitException(Exception):
+    def __init__(self, message):
+        super().__init__(message)
+
+
+
+class _RateLimiter:
+    def __init__(self, max_per_second: float):
+        self._interval = 1 / max_per_second
+        self._next_slot = 0.0
+
+    async def wait(self):
+        now = asyncio.get_running_loop().time()
+        delay = self._next_slot - now
+        self._next_slot = max(now, self._next_slot) + self._interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+
+# atproto pulls in pydantic, httpx and all lexicon models, which takes about a second. It's
+# imported where it's used, so the CLI answers --help right away.
+# pylint: disable=import-outside-toplevel
+
+@cache
+def _requests() -> SimpleNamespace:
+    import httpx
+    from atproto_client.request import AsyncRequest, Request, RequestBase
+
+    try:
+        from orjson import loads as json_loads
+    except ImportError:
+        from pydantic_core import from_json as json_loads
+
+    # RequestBase.__init__ instead of super().__init__(), which would open a default client
+    class PooledRequest(Request):
+        def __init__(self):  # pylint: disable=super-init-not-called
+            RequestBase.__init__(self)  # pylint: disable=non-parent-init-called
+            self._client = httpx.Client(follow_redirects=True, http2=HTTP2,
+                                        limits=httpx.Limits(**HTTP_LIMITS))
+
+    class PooledAsyncRequest(AsyncRequest):
+        def __init__(self):  # pylint: disable=super-init-not-called
+            RequestBase.__init__(self)  # pylint: disable=non-parent-init-called
+            self._client = httpx.AsyncClient(follow_redirects=True, http2=HTTP2,
+                                             limits=httpx.Limits(**HTTP_LIMITS))
+
+    class JsonRequest(PooledAsyncRequest):
+        async def get_json(self, url: str, **kwargs) -> dict:
+            response = await self._send_request('GET', url, **kwargs)
+            return json_loads(response.content)
+
+    return SimpleNamespace(pooled=PooledRequest, pooled_async=PooledAsyncRequest, json=JsonRequest)
+
+
+@cache
+def _retryable_errors() -> tuple:
+    import httpx
+    from atproto.exceptions import NetworkError, RequestException
+    return RequestException, NetworkError, httpx.HTTPStatusError, httpx.TransportError
+
+
+
 class BskyListTool:
     def __init__(self, handle: str=None, password: str=None, cred_file: Union[Path,str]=None,
-                 token_file: Union[Path, str]=None):
+                 token_file: Union[Path, str]=None, cache_file: Union[Path, str]='.bsky_cache.db'):
         token = self._read_token_from_file(token_file)
-        if cred_file is not Path:
+        if cred_file is not None and not isinstance(cred_file, Path):
             cred_file = Path(cred_file)
         file_handle = None
         file_pw = None
-        if cred_file.exists():
+        if cred_file is not None and cred_file.exists():
            file_handle, file_pw =  self._parse_config_file(cred_file)
         if handle is None:
             if file_handle is None:
@@ -33,8 +122,17 @@ class BskyListTool:
             password = file_pw
         self.token_file = token_file
         self.handle = handle
-        self.client = Client()
-        self.resolver = IdResolver()
+        from atproto import Client
+        self.client = Client(request=_requests().pooled())
+        self._cache = sqlite3.connect(cache_file)
+        self._cache.execute(
+            'CREATE TABLE IF NOT EXISTS did_cache '
+            '(handle TEXT PRIMARY KEY, did TEXT, expires_at INTEGER)')
+        self._cache.execute(
+            'CREATE TABLE IF NOT EXISTS list_uri_cache '
+            '(listname TEXT, owner TEXT, uri TEXT, expires_at INTEGER, '
+            'PRIMARY KEY (listname, owner))')
+        self._list_uri_cache: dict[tuple[str, str], str] = {}
         if token is None:
             self.client.login(handle, password)
         else:
@@ -45,6 +143,8 @@ class BskyListTool:
 
     def __exit__(self, type, value, traceback):
         self.save_token()
+        self.client.request.close()
+        self._cache.close()
 
     @staticmethod
     def _parse_config_file(file: Path):
@@ -61,7 +161,9 @@ class BskyListTool:
 
     @staticmethod
     def _read_token_from_file(file: Union[Path, str]) -> Union[str, None]:
-        if file is not Path:
+        if file is None:
+            return None
+        if not isinstance(file, Path):
             file = Path(file)
         if file.exists():
             with open(file, 'r', encoding='utf-8') as f:
@@ -71,87 +173,334 @@ class BskyListTool:
             return None
 
     def save_token(self):
+        if self.token_file is None:
+            return
         token = self.client.export_session_string()
         with open(self.token_file, 'w', encoding='utf-8') as f:
             f.write(token)
 
-    def add_file_to_list(self, listname: str, file: Union[Path, str]) -> None:
-        if file is not Path:
+    def add_file_to_list(self, listname: str, file: Union[Path, str], max_at_once: int = 20,
+                         max_per_second: float = 5, resume: bool = False) -> None:
+        if not isinstance(file, Path):
             file = Path(file)
         if not file.exists():
             raise FileNotFoundError(f'File {file} could not be found.')
         uri = self._get_list_uri(listname, self.handle)
         with open(file, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.strip():
-                    line = line.rstrip()
-                    if line.startswith('@'):
-                        line = line[1::]
-                    if not line.startswith('did:'):
-                        line = self.resolver.handle.resolve(line)
-                    self.client.app.bsky.graph.listitem.create(
-                        self.handle,
-                        models.AppBskyGraphListitem.Record(
-                            list=uri,
-                            subject=line,
-                            created_at=self.client.get_current_time_iso()
-                        )
+            # dict instead of set: drops duplicates but keeps the order of the file
+            entries = list(dict.fromkeys(line.strip().removeprefix('@')
+                                         for line in f if line.strip()))
+        # The checkpoint holds the number of entries done, a hash of them to notice a changed
+        # input file, and the DIDs added so far, so a DID isn't added again through its handle.
+        checkpoint = file.with_name(file.name + '.pos')
+        state = {'done': 0, 'digest': hashlib.sha256().hexdigest(), 'added': []}
+        if resume and checkpoint.exists():
+            state = json.loads(checkpoint.read_text(encoding='utf-8'))
+            digest = hashlib.sha256()
+            self._update_digest(digest, entries[:state['done']])
+            if digest.hexdigest() != state['digest']:
+                raise ValueError(f'{file} changed since the last run, '
+                                 f'remove {checkpoint} to start over.')
+        asyncio.run(self._add_entries_to_list(uri, entries, state['done'], set(state['added']),
+                                              checkpoint, max_at_once, max_per_second))
+        checkpoint.unlink(missing_ok=True)
+
+    @staticmethod
+    def _update_digest(digest, entries: list):
+        for entry in entries:
+            digest.update(entry.encode('utf-8') + b'\n')
+
+    async def _add_entries_to_list(self, uri: str, entries: list, done: int, added: set,
+                                   checkpoint: Path, max_at_once: int, max_per_second: float):
+        import httpx
+        from atproto import AsyncClient, models
+        session = self.client.export_session_string()
+        client = AsyncClient(request=_requests().pooled_async())
+        await self._with_backoff(partial(client.login, session_string=session))
+        semaphore = asyncio.Semaphore(max_at_once)
+        limiter = _RateLimiter(max_per_second)
+
+        http = httpx.AsyncClient(follow_redirects=True, http2=HTTP2,
+                                 limits=httpx.Limits(**HTTP_LIMITS))
+
+        # Errors that outlast the retries end the run before anything is written, so the
+        # handle isn't counted as done and a later --resume tries it again.
+        async def resolve(handle: str) -> Union[str, None]:
+            async with semaphore:
+                did = await self._resolve_cached(http, handle)
+            if did is None:
+                print(f'Skipping {handle}: the handle could not be resolved.', file=sys.stderr)
+            return did
+
+        try:
+            handles = [entry for entry in entries[done:] if not entry.startswith('did:')]
+            resolved = dict(zip(handles,
+                                await asyncio.gather(*(resolve(handle) for handle in handles))))
+            digest = hashlib.sha256()
+            self._update_digest(digest, entries[:done])
+            # Batches follow the order of the file, so the number of entries done so far is
+            # all that's needed to pick up after the last successful batch.
+            for start in range(done, len(entries), APPLY_WRITES_BATCH_SIZE):
+                batch = entries[start:start + APPLY_WRITES_BATCH_SIZE]
+                dids = [did for did in dict.fromkeys(resolved.get(entry, entry) for entry in batch)
+                        if did is not None and did not in added]
+                created_at = client.get_current_time_iso()
+                writes = [
+                    models.ComAtprotoRepoApplyWrites.Create(
+                        collection='app.bsky.graph.listitem',
+                        value=models.AppBskyGraphListitem.Record(list=uri, subject=did,
+                                                                 created_at=created_at)
                     )
+                    for did in dids
+                ]
+                if writes:
+                    data = models.ComAtprotoRepoApplyWrites.Data(repo=self.handle, writes=writes)
+                    # Records without rkey would be created twice if a write went through but its
+                    # answer got lost, so only retry when the server refused it with 429.
+                    await self._with_backoff(partial(client.com.atproto.repo.apply_writes, data),
+                                             limiter, idempotent=False)
+                added.update(dids)
+                self._update_digest(digest, batch)
+                checkpoint.write_text(json.dumps({'done': start + len(batch),
+                                                  'digest': digest.hexdigest(),
+                                                  'added': list(added)}), encoding='utf-8')
+        finally:
+            await http.aclose()
+            await client.request.close()
+            # A session refresh in the async client rotates the tokens, so hand them back.
+            if client.export_session_string() != session:
+                self.client.login(session_string=client.export_session_string())
 
-    def backup_list(self, listname: str, owner: str, file: Path):
+    async def _resolve_cached(self, http: httpx.AsyncClient, handle: str) -> Union[str, None]:
+        did = self._get_cached_did(handle)
+        if did is None:
+            did = await self._resolve_handle_async(http, handle)
+            self._store_did(handle, did)
+        return did
+
+    def _resolve_handle_cached(self, handle: str) -> str:
+        did = self._get_cached_did(handle)
+        if did is None:
+            did = self._with_backoff_sync(partial(self.client.resolve_handle, handle)).did
+            self._store_did(handle, did)
+        return did
+
+    def _get_cached_did(self, handle: str) -> Union[str, None]:
+        row = self._cache.execute(
+            'SELECT did FROM did_cache WHERE handle = ? AND expires_at > ?',
+            (handle, int(time.time()))
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def _store_did(self, handle: str, did: Union[str, None]):
+        with self._cache:
+            if did is None:
+                # The handle moved away or was given up, so an older entry must not be reused.
+                self._cache.execute('DELETE FROM did_cache WHERE handle = ?', (handle,))
+            else:
+                self._cache.execute('INSERT OR REPLACE INTO did_cache VALUES (?, ?, ?)',
+                                    (handle, did, int(time.time()) + CACHE_TTL))
+
+    @staticmethod
+    async def _resolve_handle_async(http: httpx.AsyncClient, handle: str) -> Union[str, None]:
+        # DNS takes precedence, but both lookups start at once, so handles without a TXT record
+        # (like all *.bsky.social handles) don't wait for the failed DNS query first.
+        dns_lookup = asyncio.create_task(BskyListTool._resolve_dns(handle))
+        http_lookup = asyncio.create_task(
+            BskyListTool._with_backoff(partial(BskyListTool._resolve_well_known, http, handle)))
+        try:
+            did = await dns_lookup
+            if did is None:
+                did = await http_lookup
+            return did
+        finally:
+            # cancels the HTTP lookup when DNS won or failed; done tasks are left alone
+            http_lookup.cancel()
+            await asyncio.gather(dns_lookup, http_lookup, return_exceptions=True)
+
+    @staticmethod
+    async def _resolve_dns(handle: str) -> Union[str, None]:
+        import dns.asyncresolver
+        from dns.exception import DNSException
+        try:
+            answers = await dns.asyncresolver.resolve(f'_atproto.{handle}', 'TXT')
+        except DNSException:
+            return None
+        for answer in answers:
+            for value in answer.strings:
+                value = value.decode('utf-8')
+                if value.startswith('did='):
+                    return value.removeprefix('did=')
+        return None
+
+    @staticmethod
+    async def _resolve_well_known(http: httpx.AsyncClient, handle: str) -> Union[str, None]:
+        import httpx
+        # atproto's resolve_http turns every error into None, which would make a rate limited
+        # or failing server look like a handle that's gone. Only those errors are raised here.
+        try:
+            response = await http.get(f'https://{handle}/.well-known/atproto-did')
+        except httpx.ConnectError:
+            return None
+        if response.status_code == 429 or response.status_code >= 500:
+            response.raise_for_status()
+        if response.status_code != 200:
+            return None
+        lines = response.text.splitlines()
+        did = lines[0].strip() if lines else ''
+        return did if did.startswith('did:') else None
+
+    @staticmethod
+    def _retry_delay(error: Exception, attempt: int, idempotent: bool = True) -> Union[float, None]:
+        response = getattr(error, 'response', None)
+        if not idempotent and (response is None or response.status_code != 429):
+            return None
+        # no response at all means a timeout or a dropped connection, which is worth another try
+        if response is not None and response.status_code < 500:
+            if response.status_code != 429:
+                return None
+            # Bluesky sends ratelimit-* headers on every answer, so they only mean a wait on 429
+            wait = None
+            retry_after = response.headers.get('retry-after')
+            # Bluesky sends the end of the current rate limit window as unix timestamp
+            reset = response.headers.get('ratelimit-reset')
+            if retry_after is not None and retry_after.isdigit():
+                wait = float(retry_after)
+            elif reset is not None and reset.isdigit():
+                wait = max(0.0, int(reset) - time.time())
+            if wait is not None:
+                if wait > MAX_RETRY_BACKOFF:
+                    raise RateLimitException(
+                        f'Rate limited by the server for another {wait:.0f} seconds, '
+                        'try again later with --resume.') from error
+                return wait
+        return min(MAX_RETRY_BACKOFF, 2 ** attempt) + random.uniform(0, 1)
+
+    @staticmethod
+    def _with_backoff_sync(request: Callable, max_attempts: int = RETRY_ATTEMPTS,
+                           idempotent: bool = True):
+        for attempt in range(max_attempts):
+            try:
+                return request()
+            except _retryable_errors() as e:
+                delay = BskyListTool._retry_delay(e, attempt, idempotent)
+                if delay is None or attempt == max_attempts - 1:
+                    raise
+                time.sleep(delay)
+
+    @staticmethod
+    async def _with_backoff(request: Callable, limiter: _RateLimiter = None,
+                            max_attempts: int = RETRY_ATTEMPTS, idempotent: bool = True):
+        for attempt in range(max_attempts):
+            if limiter is not None:
+                await limiter.wait()
+            try:
+                return await request()
+            except _retryable_errors() as e:
+                delay = BskyListTool._retry_delay(e, attempt, idempotent)
+                if delay is None or attempt == max_attempts - 1:
+                    raise
+                await asyncio.sleep(delay)
+
+    def backup_list(self, listname: str, owner: str, file: Path, resume: bool = False):
         uri = self._get_list_uri(listname, owner)
-        cursor = None
-        with open(file, 'w', encoding='utf-8') as f:
-            while True:
-                bskylist = self.client.app.bsky.graph.get_list(
-                    models.AppBskyGraphGetList.Params(list=uri, limit=100, cursor=cursor)
-                )
-                cursor = bskylist.cursor
-                for entry in bskylist.items:
-                    f.write(entry.subject.did + '\n')
-                if cursor is None:
-                    break
-
-    def get_followers(self, handle: str, file: Union[Path, str]):
-        cursor = None
-        with open(file, 'w', encoding='utf-8') as f:
-            while True:
-                followers = self.client.get_followers(actor=handle, limit=100, cursor=cursor)
-                cursor = followers.cursor
-                for follower in followers.followers:
-                    f.write(follower.did + '\n')
-                if cursor is None:
-                    break
-
-    def get_likes(self, post_url: str, file: Union[Path, str]):
+        asyncio.run(self._paged_fetch('app.bsky.graph.getList', {'list': uri}, 'items',
+                                      lambda entry: entry['subject']['did'], file, resume))
+
+    def get_followers(self, handle: str, file: Union[Path, str], resume: bool = False):
+        asyncio.run(self._paged_fetch('app.bsky.graph.getFollowers', {'actor': handle}, 'followers',
+                                      lambda follower: follower['did'], file, resume))
+
+    def get_likes(self, post_url: str, file: Union[Path, str], resume: bool = False):
         at_uri = self._link_to_at_uri(post_url)
-        cursor = None
-        with open(file, 'w', encoding='utf-8') as f:
-            while True:
-                response = self.client.get_likes(uri=at_uri, limit=100, cursor=cursor)
-                cursor = response.cursor
-                for like in response.likes:
-                    f.write(like.actor.did + '\n')
-                if cursor is None:
-                    break
+        asyncio.run(self._paged_fetch('app.bsky.feed.getLikes', {'uri': at_uri}, 'likes',
+                                      lambda like: like['actor']['did'], file, resume))
+
+    async def _paged_fetch(self, nsid: str, params: dict, item_key: str, get_did: Callable,
+                           file: Union[Path, str], resume: bool = False,
+                           cursor_key: str = 'cursor'):
+        # The read-only endpoints are served by the public AppView, so one unauthenticated
+        # keep-alive client is enough. The next page is requested before the current one
+        # is written to disk, so the write never adds to the roundtrip time. Only the DIDs
+        # are needed, so the raw JSON is used instead of building the response models.
+        request = _requests().json()
+        fetch = partial(request.get_json, f'{PUBLIC_API_URL}/xrpc/{nsid}')
+        # The checkpoint holds the size of the file after the last complete page and the
+        # cursor of the page after it.
+        checkpoint = Path(f'{file}.cursor')
+        params = {**params, 'limit': PAGE_LIMIT}
+        size = None
+        if resume and checkpoint.exists():
+            size, cursor = checkpoint.read_text(encoding='utf-8').split('\n', 1)
+            if Path(file).exists() and Path(file).stat().st_size >= int(size):
+                params['cursor'] = cursor
+            else:
+                print(f'{file} is missing or shorter than at the last run, starting over.',
+                      file=sys.stderr)
+                size = None
+        try:
+            with open(file, 'w' if size is None else 'a', encoding='utf-8',
+                      buffering=WRITE_BUFFER_SIZE) as f:
+                if size is not None:
+                    f.truncate(int(size))
+                next_page = asyncio.create_task(self._with_backoff(partial(fetch, params=params)))
+                while next_page is not None:
+                    response = await next_page
+                    cursor = response.get(cursor_key)
+                    next_page = None
+                    if cursor is not None:
+                        # the previous request is done, so the dict can be reused for the next one
+                        params['cursor'] = cursor
+                        next_page = asyncio.create_task(
+                            self._with_backoff(partial(fetch, params=params)))
+                    items = response[item_key]
+                    if items:
+                        f.write('\n'.join(get_did(item) for item in items) + '\n')
+                    if cursor is not None:
+                        f.flush()
+                        checkpoint.write_text(f'{f.tell()}\n{cursor}', encoding='utf-8')
+            checkpoint.unlink(missing_ok=True)
+        finally:
+            await request.close()
 
     def _get_list_uri(self, listname: str, owner: str) -> str:
-        response = self.client.app.bsky.graph.get_lists(
-            models.AppBskyGraphGetLists.Params(
-                actor=owner))
-        for l in response.lists:
-            if l['name'] == listname:
-                uri = l['uri']
-                break
-        else:
-            raise ListNotFoundException(f'List with name {listname} could not be found.')
-        return uri
+        key = (listname, owner)
+        if key not in self._list_uri_cache:
+            row = self._cache.execute(
+                'SELECT uri FROM list_uri_cache '
+                'WHERE listname = ? AND owner = ? AND expires_at > ?',
+                (listname, owner, int(time.time()))
+            ).fetchone()
+            if row is None:
+                uri = self._fetch_list_uri(listname, owner)
+                with self._cache:
+                    self._cache.execute('INSERT OR REPLACE INTO list_uri_cache VALUES (?, ?, ?, ?)',
+                                        (listname, owner, uri, int(time.time()) + CACHE_TTL))
+            else:
+                uri = row[0]
+            self._list_uri_cache[key] = uri
+        return self._list_uri_cache[key]
+
+    def _fetch_list_uri(self, listname: str, owner: str) -> str:
+        from atproto import models
+        params = models.AppBskyGraphGetLists.Params(actor=owner, limit=PAGE_LIMIT)
+        while True:
+            response = self._with_backoff_sync(
+                partial(self.client.app.bsky.graph.get_lists, params))
+            for l in response.lists:
+                if l['name'] == listname:
+                    return l['uri']
+            params.cursor = response.cursor
+            if params.cursor is None:
+                raise ListNotFoundException(f'List with name {listname} could not be found.')
 
     def _link_to_at_uri(self, link: str) -> str:
-        http_url = link.split('/')
-        profile = http_url[4]
-        rkey = http_url[6]
-        did = self.client.resolve_handle(profile).did
+        # https://bsky.app/profile/<handle or did>/post/<rkey>
+        path = urlsplit(link).path.strip('/').split('/')
+        if len(path) != 4 or path[0] != 'profile' or path[2] != 'post':
+            raise ValueError(f'{link} is not a link to a post.')
+        profile, rkey = path[1], path[3]
+        did = profile if profile.startswith('did:') else self._resolve_handle_cached(profile)
         at_uri = f"at://{did}/app.bsky.feed.post/{rkey}"
         return at_uri
 
@@ -165,26 +514,31 @@ if __name__ == "__main__":
     add_p = list_subp.add_parser('add')
     add_p.add_argument('target_list_name')
     add_p.add_argument('file')
+    add_p.add_argument('--resume', action='store_true')
     fetch_p = subp.add_parser('fetch')
     fetch_subp = fetch_p.add_subparsers(dest='operation')
     f_list_p = fetch_subp.add_parser('list')
     f_list_p.add_argument('owner')
     f_list_p.add_argument('list_name')
     f_list_p.add_argument('file')
+    f_list_p.add_argument('--resume', action='store_true')
     follower_p = fetch_subp.add_parser('followers')
     follower_p.add_argument('handle')
     follower_p.add_argument('file')
+    follower_p.add_argument('--resume', action='store_true')
     f_likes_p = fetch_subp.add_parser('likes')
     f_likes_p.add_argument('url')
     f_likes_p.add_argument('file')
+    f_likes_p.add_argument('--resume', action='store_true')
 
     args = p.parse_args()
-    with BskyListTool(cred_file='./config', token_file='./.bsky.token') as tool:
+    with BskyListTool(cred_file='./config', token_file='./.bsky.token',
+                      cache_file='./.bsky_cache.db') as tool:
         match args.main_menu:
             case 'list':
                 match args.operation:
                     case 'add':
-                        tool.add_file_to_list(args.target_list_name, args.file)
+                        tool.add_file_to_list(args.target_list_name, args.file, resume=args.resume)
                     case 'download':
                         tool.backup_list(args.list_name, args.owner, args.file)
                     case 'followers':
@@ -192,8 +546,8 @@ if __name__ == "__main__":
             case 'fetch':
                 match args.operation:
                     case 'list':
-                        tool.backup_list(args.list_name, args.owner, args.file)
+                        tool.backup_list(args.list_name, args.owner, args.file, resume=args.resume)
                     case 'followers':
-                        tool.get_followers(args.handle, args.file)
+                        tool.get_followers(args.handle, args.file, resume=args.resume)
                     case 'likes':
-                        tool.get_likes(args.url, args.file)
+                        tool.get_likes(args.url, args.file, resume=args.resume)